@@ -1,14 +1,189 @@
 import os       # Python standard library module
-import json     # Used for structured logging
+import sys      # Used to write log lines as bytes to stdout
 import time     # Used for EMF metric timestamp
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed  # Parallel release_address calls
+from typing import Any
 
 import boto3    # third-party, AWS SDK for Python, to interact with AWS services from Lambda
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
-def log(level, message, **fields):
+# orjson (C extension) serializes straight to bytes and is several times faster than json.dumps.
+# It is shipped via requirements.txt; fall back to the standard library if it is not packaged.
+# The fallback uses compact separators and raw UTF-8 so both produce the same log lines.
+try:
+    import orjson
+
+    def _dumps(obj: object) -> bytes:
+        return orjson.dumps(obj, default=str)
+
+except ImportError:
+    import json
+
+    def _dumps(obj: object) -> bytes:
+        return json.dumps(obj, default=str, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+# ------------------------------------------------------------
+# Configuration (Lambda env vars are immutable for the lifetime of an execution environment,
+# so they are read once at cold start instead of on every invocation)
+# ------------------------------------------------------------
+
+# Dry-run default, used when the event does not carry "dry_run"
+_DEFAULT_DRY_RUN = os.getenv("DRY_RUN", "false").lower() == "true"
+
+# Safety controls (tag-based allow-list + protection)
+# Only EIPs explicitly tagged as "managed" will be considered for release.
+_MANAGED_TAG_KEY = os.getenv("MANAGED_TAG_KEY", "ManagedBy")
+_MANAGED_TAG_VALUE = os.getenv("MANAGED_TAG_VALUE", "ManageEIPs")
+
+# If an EIP has this protection tag/value, it will never be released.
+_PROTECT_TAG_KEY = os.getenv("PROTECT_TAG_KEY", "Protection")
+_PROTECT_TAG_VALUE = os.getenv("PROTECT_TAG_VALUE", "DoNotRelease")
+
+# Optional custom metrics via EMF (in addition to AWS/Lambda built-ins)
+_METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+_METRICS_NAMESPACE = os.getenv("METRICS_NAMESPACE", "Custom/FinOps")
+
+# Per-EIP skip lines are only logged at DEBUG level.
+# The end-of-execution summary always reports the skip counters.
+_LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+_DEBUG_ENABLED = _LOG_LEVEL == "DEBUG"
+
+# Number of release_address calls allowed in flight at the same time
+_RELEASE_CONCURRENCY = int(os.getenv("RELEASE_CONCURRENCY", "8"))
+if _RELEASE_CONCURRENCY < 1:
+    raise ValueError(f"RELEASE_CONCURRENCY must be >= 1, got {_RELEASE_CONCURRENCY}")
+
+# Optional fan-out for very large fleets: above the threshold, release candidates are split into shards
+# and handed to asynchronous ("Event") invocations of the worker function instead of being released here.
+# Unset by default: the template only sets it when the EnableReleaseFanout parameter is "true".
+_WORKER_FUNCTION_ARN = os.getenv("WORKER_FUNCTION_ARN", "")
+_RELEASE_FANOUT_THRESHOLD = int(os.getenv("RELEASE_FANOUT_THRESHOLD", "50"))
+_RELEASE_SHARD_SIZE = int(os.getenv("RELEASE_SHARD_SIZE", "25"))
+if _RELEASE_SHARD_SIZE < 1:
+    raise ValueError(f"RELEASE_SHARD_SIZE must be >= 1, got {_RELEASE_SHARD_SIZE}")
+
+# Run counters: summary log field name -> EMF metric name.
+# Single source of truth for the completion summary and the EMF record.
+_COUNTER_METRIC_NAMES = {
+    "scanned": "EIPsScanned",
+    "skipped_not_managed": "EIPsSkippedNotManaged",
+    "skipped_protected": "EIPsSkippedProtected",
+    "associated": "EIPsAssociated",
+    "would_release": "EIPsWouldRelease",
+    "released": "EIPsReleased",
+    "dispatched": "EIPsDispatched",
+    "per_eip_errors": "EIPsPerEipErrors",
+}
+
+# Worker invocations re-describe EIPs the parent already scanned and counted: they only publish
+# release outcomes, so scan metrics (EIPsScanned, EIPsAssociated, ...) are not counted twice.
+_WORKER_COUNTER_METRIC_NAMES = {
+    field_name: _COUNTER_METRIC_NAMES[field_name] for field_name in ("released", "per_eip_errors")
+}
+
+# EMF metric directives: constant for this Lambda, so they are built once instead of on every emit
+_EMF_CLOUDWATCH_METRICS = [
+    {
+        "Namespace": _METRICS_NAMESPACE,
+        "Dimensions": [["FunctionName"]],
+        "Metrics": [{"Name": name, "Unit": "Count"} for name in _COUNTER_METRIC_NAMES.values()],
+    }
+]
+_EMF_WORKER_CLOUDWATCH_METRICS = [
+    {
+        "Namespace": _METRICS_NAMESPACE,
+        "Dimensions": [["FunctionName"]],
+        "Metrics": [{"Name": name, "Unit": "Count"} for name in _WORKER_COUNTER_METRIC_NAMES.values()],
+    }
+]
+
+
+# EC2 client created once per execution environment (cold start) and reused by warm invocations.
+# boto3 clients are thread-safe: the connection pool is sized to the release workers (never below
+# botocore's default of 10) so they do not queue on urllib3's pool, and TCP keepalive keeps those
+# connections warm between releases. Adaptive retries add client-side rate limiting (token bucket)
+# on top of backoff, so ReleaseAddress throttling (RequestLimitExceeded) slows the callers down
+# instead of burning retries.
+_EC2 = boto3.client(
+    "ec2",
+    config=Config(
+        max_pool_connections=max(_RELEASE_CONCURRENCY, 10),
+        retries={"max_attempts": 10, "mode": "adaptive"},
+        tcp_keepalive=True
+    )
+)
+
+# Lambda client, only needed to fan releases out to worker invocations (created on first use)
+_LAMBDA: Any | None = None
+
+# Systemic auth/permission problems: fail fast instead of treating them as per-EIP failures
+_FAIL_FAST_CODES = frozenset({
+    "AccessDenied",
+    "AccessDeniedException",
+    "UnauthorizedOperation",
+    "UnrecognizedClientException",
+    "InvalidClientTokenId",
+    "SignatureDoesNotMatch",
+    "ExpiredToken",
+})
+
+# Log lines are buffered and written to stdout in chunks instead of one write per line.
+# The buffer is always flushed when the handler returns or raises.
+_LOG_BUFFER: list[bytes] = []
+_LOG_BUFFER_MAX_LINES = 64
+
+def _write(payload: bytes) -> None:
     """
-    Emit a single structured JSON log line to stdout.
-    CloudWatch Logs captures stdout automatically.
+    Write already-serialized, newline-terminated JSON lines (bytes) to stdout in a single write.
+    Writing bytes skips the str -> bytes encode step that print() performs.
+    """
+    out = sys.stdout.buffer
+    out.write(payload)
+    out.flush()
+
+
+def _lambda_client() -> Any:
+    """
+    Return the module-level Lambda client, creating it on first use.
+    Invocations that never fan out do not pay for its creation.
+    """
+    global _LAMBDA
+    if _LAMBDA is None:
+        _LAMBDA = boto3.client("lambda")
+    return _LAMBDA
+
+
+def _get_tag_values(
+    tags: Iterable[Mapping[str, str]], key1: str, key2: str
+) -> tuple[str | None, str | None]:
+    """
+    Read two tag values from an AWS 'Tags' list in a single pass:
+    tags = [{"Key": "...", "Value": "..."}, ...]
+    Stops as soon as both keys are found; a missing key yields None.
+    """
+    value1 = value2 = None
+
+    for t in tags:
+        key = t.get("Key")
+        if key == key1:
+            value1 = t.get("Value")
+        elif key == key2:
+            value2 = t.get("Value")
+        else:
+            continue
+
+        if value1 is not None and value2 is not None:
+            break
+
+    return value1, value2
+
+
+def _format_log(level: str, message: str, **fields: object) -> bytes:
+    """
+    Serialize a single structured JSON log line (bytes, newline-terminated).
     """
     log_event = {
         "level": level,
@@ -16,80 +191,94 @@ def log(level, message, **fields):
         **fields
     }
 
-    # Make sure the **fields I pass includes a serializable object, i.e. a string.
-    # Otherwise, json.dumps will raise TypeError and the Lambda will crash.
-    print(json.dumps(log_event, default=str))
+    # Non-serializable **fields are converted with str() (default=str),
+    # so a stray object cannot raise TypeError and crash the Lambda.
+    return _dumps(log_event) + b"\n"
 
 
+def log(level: str, message: str, **fields: object) -> None:
+    """
+    Emit a single structured JSON log line to stdout (through the log buffer).
+    CloudWatch Logs captures stdout automatically.
+    """
+    _LOG_BUFFER.append(_format_log(level, message, **fields))
+    if len(_LOG_BUFFER) >= _LOG_BUFFER_MAX_LINES:
+        _flush_logs()
 
 
-def _get_tag_value(tags, key):
+def _flush_logs() -> None:
     """
-    Safely read a tag value from an AWS 'Tags' list:
-    tags = [{"Key": "...", "Value": "..."}, ...]
+    Write every buffered log line to stdout in a single write, then empty the buffer.
     """
-    if not tags:
-        return None
-
-    for t in tags:
-        if t.get("Key") == key:
-            return t.get("Value")
+    if _LOG_BUFFER:
+        payload = b"".join(_LOG_BUFFER)
+        _LOG_BUFFER.clear()
+        _write(payload)
 
-    return None
 
 
 
-def emit_emf_metrics(namespace, dimensions, metrics):
+def _format_emf_metrics(
+    function_name: str, counters: Mapping[str, int], timestamp_ms: int, worker: bool = False
+) -> bytes:
     """
-    Emit CloudWatch custom metrics via Embedded Metric Format (EMF).
-    This is written to logs; CloudWatch can extract metrics automatically.
+    Serialize CloudWatch custom metrics as an Embedded Metric Format (EMF) line (bytes, newline-terminated).
+    Once written to logs, CloudWatch can extract the metrics automatically.
 
     AWS official position: EMF is the preferred way to publish custom metrics from Lambda.
 
     Notes:
     - This does NOT replace AWS/Lambda built-in metrics (Invocations, Errors, Duration, Throttles).
     - It supplements them with project metrics like EIPsReleased / EIPsWouldRelease.
-    """
-    metric_definitions = []
-    for metric_name in metrics.keys():
-        metric_definitions.append({"Name": metric_name, "Unit": "Count"})
 
-    emf_event = {
+    `timestamp_ms` is taken once per invocation by the caller, so every record of a run shares it.
+    Only the timestamp and the values change per call: the metric directive
+    (namespace, dimensions, metric definitions) is prebuilt at module load.
+    `counters` is keyed by summary field name and must provide every key of _COUNTER_METRIC_NAMES.
+    With `worker=True`, only the release outcomes (_WORKER_COUNTER_METRIC_NAMES) are published.
+    """
+    metric_names = _WORKER_COUNTER_METRIC_NAMES if worker else _COUNTER_METRIC_NAMES
+    emf_event: dict[str, Any] = {
         "_aws": {
-            "Timestamp": int(time.time() * 1000),
-            "CloudWatchMetrics": [
-                {
-                    "Namespace": namespace,
-                    "Dimensions": [list(dimensions.keys())],
-                    "Metrics": metric_definitions,
-                }
-            ],
+            "Timestamp": timestamp_ms,
+            "CloudWatchMetrics": _EMF_WORKER_CLOUDWATCH_METRICS if worker else _EMF_CLOUDWATCH_METRICS,
         },
-        **dimensions,
-        **metrics,
+        "FunctionName": function_name,
     }
-    print(json.dumps(emf_event))
+    for field_name, metric_name in metric_names.items():
+        emf_event[metric_name] = counters[field_name]
 
+    return _dumps(emf_event) + b"\n"
 
 
 
-def lambda_handler(event, context):
-    # Dry-run flag: when true, only logs which EIPs would be released (no destructive action).
-    # Priority: event.json ("dry_run") overrides Lambda env var ("DRY_RUN").
-    dry_run = str(event.get("dry_run", os.getenv("DRY_RUN", "false"))).lower() == "true"
-    
-    # Safety controls (tag-based allow-list + protection)
-    # Only EIPs explicitly tagged as "managed" will be considered for release.
-    MANAGED_TAG_KEY = os.getenv("MANAGED_TAG_KEY", "ManagedBy")
-    MANAGED_TAG_VALUE = os.getenv("MANAGED_TAG_VALUE", "ManageEIPs")
 
-    # If an EIP has this protection tag/value, it will never be released.
-    PROTECT_TAG_KEY = os.getenv("PROTECT_TAG_KEY", "Protection")
-    PROTECT_TAG_VALUE = os.getenv("PROTECT_TAG_VALUE", "DoNotRelease")
+def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
+    try:
+        return _handle(event, context)
+    finally:
+        # Includes the ERROR lines logged right before an exception is re-raised
+        _flush_logs()
+
 
-    # Optional custom metrics via EMF (in addition to AWS/Lambda built-ins)
-    METRICS_ENABLED = str(os.getenv("METRICS_ENABLED", "true")).lower() == "true"
-    METRICS_NAMESPACE = os.getenv("METRICS_NAMESPACE", "Custom/FinOps")
+def _handle(event: dict[str, Any], context: Any) -> dict[str, Any]:
+    # Single timestamp for every EMF record emitted by this invocation
+    started_ms = int(time.time() * 1000)
+
+    # Dry-run flag: when true, only logs which EIPs would be released (no destructive action).
+    # Priority: event.json ("dry_run") overrides Lambda env var ("DRY_RUN").
+    # EventBridge/JSON events usually carry a real bool, so it is used as-is; strings like "true"/"1"/"yes" are accepted too.
+    dry_run_value = event.get("dry_run")
+    if dry_run_value is None:
+        dry_run = _DEFAULT_DRY_RUN
+    elif isinstance(dry_run_value, bool):
+        dry_run = dry_run_value
+    else:
+        dry_run = str(dry_run_value).strip().lower() in ("true", "1", "yes")
+
+    # Worker invocation: the parent passes the allocation IDs to release.
+    # They are re-checked (managed / protected / associated) before release; a worker never fans out again.
+    allocation_ids = event.get("allocation_ids")
 
     # Always log at least one line so CloudWatch proves what mode you ran in
     log(
@@ -98,109 +287,114 @@ def lambda_handler(event, context):
         dry_run=dry_run,
         function_name=context.function_name if context else None,
         request_id=context.aws_request_id if context else None,
-        managed_tag_key=MANAGED_TAG_KEY,
-        managed_tag_value=MANAGED_TAG_VALUE,
-        protect_tag_key=PROTECT_TAG_KEY,
-        protect_tag_value=PROTECT_TAG_VALUE,
-        metrics_enabled=METRICS_ENABLED,
-        metrics_namespace=METRICS_NAMESPACE
+        managed_tag_key=_MANAGED_TAG_KEY,
+        managed_tag_value=_MANAGED_TAG_VALUE,
+        protect_tag_key=_PROTECT_TAG_KEY,
+        protect_tag_value=_PROTECT_TAG_VALUE,
+        metrics_enabled=_METRICS_ENABLED,
+        metrics_namespace=_METRICS_NAMESPACE,
+        log_level=_LOG_LEVEL,
+        release_concurrency=_RELEASE_CONCURRENCY,
+        worker_function_arn=_WORKER_FUNCTION_ARN or None,
+        worker_allocation_ids=allocation_ids
     )
+    # Flushed right away: this line must reach CloudWatch even if the invocation later times out
+    _flush_logs()
+
+    # A worker payload must carry a non-empty list of allocation IDs: anything else is rejected as a no-op
+    # (an empty "allocation-id" filter would otherwise fail DescribeAddresses with a validation error)
+    worker = allocation_ids is not None
+    if worker and (
+        not isinstance(allocation_ids, list)
+        or not allocation_ids
+        or not all(isinstance(a, str) for a in allocation_ids)
+    ):
+        log(
+            "ERROR",
+            "Invalid allocation_ids in worker event, nothing released",
+            worker_allocation_ids=allocation_ids
+        )
+        return {
+            'statusCode': 400,
+            'body': 'Invalid allocation_ids.'
+        }
 
-    ec2_resource = boto3.resource('ec2')
+    ec2 = _EC2
 
-    # Counters used for summary logging and optional custom metrics
+    # Counters used for summary logging and optional custom metrics.
+    # DescribeAddresses is filtered on the managed tag server-side, so `scanned` counts managed EIPs only
+    # and `skipped_not_managed` stays 0 (kept for the defensive check below and the published EMF schema).
     scanned = 0
     skipped_not_managed = 0
     skipped_protected = 0
     associated = 0
     would_release = 0
     released = 0
+    dispatched = 0
     per_eip_errors = 0
-    
-    for elastic_ip in ec2_resource.vpc_addresses.all():
+
+    # Release candidates collected during the scan, released concurrently afterwards.
+    # Both lists are logged once, as a batch, instead of one log line per EIP.
+    to_release = []
+    released_allocation_ids = []
+
+    # Server-side filtering: AWS only returns VPC EIPs carrying the "managed" tag/value.
+    # The protection tag is still checked below, since DescribeAddresses has no negative filters.
+    # DescribeAddresses is not paginated (no MaxResults/NextToken, no boto3 paginator):
+    # one call returns the full, already-filtered candidate set, bounded by the account's EIP quota.
+    # When no managed EIP exists, this single round-trip returns an empty list and the run goes straight
+    # to the summary: a separate DescribeTags "is there anything to do?" probe would only add a call.
+    filters: list[dict[str, Any]] = [
+        {"Name": f"tag:{_MANAGED_TAG_KEY}", "Values": [_MANAGED_TAG_VALUE]},
+        {"Name": "domain", "Values": ["vpc"]},
+    ]
+    if worker:
+        # Filter (not AllocationIds=...) so an ID that is already gone is skipped instead of failing the call
+        filters.append({"Name": "allocation-id", "Values": allocation_ids})
+
+    resp = ec2.describe_addresses(Filters=filters)
+
+    for addr in resp["Addresses"]:
         scanned += 1
 
-        try:
-            # Tags may be None if not set
-            tags = getattr(elastic_ip, "tags", None) or []
+        # Read once: used by the logs, the release list and the exception handler
+        allocation_id = addr.get("AllocationId")
 
-            managed_val = _get_tag_value(tags, MANAGED_TAG_KEY)
-            protect_val = _get_tag_value(tags, PROTECT_TAG_KEY)
+        try:
+            # Tags may be missing if not set
+            managed_val, protect_val = _get_tag_values(
+                addr.get("Tags") or (), _MANAGED_TAG_KEY, _PROTECT_TAG_KEY
+            )
 
-            # Allow-list: only act on EIPs explicitly managed by this automation
-            if managed_val != MANAGED_TAG_VALUE:
+            # Allow-list: only act on EIPs explicitly managed by this automation.
+            # Defensive only: the server-side tag filter already excludes unmanaged EIPs.
+            if managed_val != _MANAGED_TAG_VALUE:
                 skipped_not_managed += 1
                 continue
 
             # Deny-list: never touch protected EIPs
-            if protect_val == PROTECT_TAG_VALUE:
+            if protect_val == _PROTECT_TAG_VALUE:
                 skipped_protected += 1
-                log(
-                    "INFO",
-                    "Skipping protected Elastic IP",
-                    allocation_id=elastic_ip.allocation_id,
-                    action="skip",
-                    reason="protected",
-                    dry_run=dry_run
-                )
+                if _DEBUG_ENABLED:
+                    log(
+                        "DEBUG",
+                        "Skipping protected Elastic IP",
+                        allocation_id=allocation_id,
+                        action="skip",
+                        reason="protected",
+                        dry_run=dry_run
+                    )
                 continue
 
             # Associated EIPs are not released
-            if elastic_ip.instance_id is not None:
+            if addr.get("InstanceId") is not None:
                 associated += 1
                 continue
 
             # Unassociated and managed => release (or would release if dry-run)
             if dry_run:
                 would_release += 1
-                log(
-                    "INFO",
-                    "Elastic IP would be released (dry-run)",
-                    allocation_id=elastic_ip.allocation_id,
-                    action="release",
-                    dry_run=True
-                )
-            else:
-                log(
-                    "INFO",
-                    "Releasing unassociated Elastic IP",
-                    allocation_id=elastic_ip.allocation_id,
-                    action="release",
-                    dry_run=False
-                )
-                elastic_ip.release()    
-                released += 1
-    
-        except ClientError as e:
-            per_eip_errors += 1
-
-            # Access denied
-            # Invalid state
-            # Throttling
-            # AWS-side validation errors
-            code = e.response.get("Error", {}).get("Code", "Unknown")
-            log(
-                "ERROR",
-                "AWS ClientError while processing Elastic IP",
-                allocation_id=getattr(elastic_ip, "allocation_id", None),
-                error_code=code,
-                error_message=str(e)
-            )
-
-            # Fail fast on systemic auth/permission problems
-            if code in {
-                "AccessDenied",
-                "AccessDeniedException",
-                "UnauthorizedOperation",
-                "UnrecognizedClientException",
-                "InvalidClientTokenId",
-                "SignatureDoesNotMatch",
-                "ExpiredToken",
-            }:
-                raise
-
-            # Otherwise treat as per-EIP failure and keep going
-            continue
+            to_release.append(allocation_id)
 
         except Exception as e:
             # For generic exceptions
@@ -211,46 +405,166 @@ def lambda_handler(event, context):
             log(
                 "ERROR",
                 "Unexpected error while processing Elastic IP",
-                allocation_id=getattr(elastic_ip, "allocation_id", None),
+                allocation_id=allocation_id,
                 error_type=type(e).__name__,
                 error_message=str(e)
             )
             raise   # Re-raise to avoid hiding critical failures
 
+    if dry_run and to_release:
+        log(
+            "INFO",
+            "Elastic IPs would be released (dry-run)",
+            allocation_ids=to_release,
+            action="release",
+            dry_run=True
+        )
+
+    fan_out = (
+        not dry_run
+        and _WORKER_FUNCTION_ARN
+        and not worker
+        and len(to_release) > _RELEASE_FANOUT_THRESHOLD
+    )
+
+    # Fan-out phase: "Event" invocations return as soon as they are queued,
+    # so this invocation is not billed for the release round-trips.
+    if fan_out:
+        lambda_client = _lambda_client()
+        for start in range(0, len(to_release), _RELEASE_SHARD_SIZE):
+            shard = to_release[start:start + _RELEASE_SHARD_SIZE]
+            try:
+                lambda_client.invoke(
+                    FunctionName=_WORKER_FUNCTION_ARN,
+                    InvocationType="Event",
+                    Payload=_dumps({"dry_run": False, "allocation_ids": shard})
+                )
+            except Exception as e:
+                # Shards queued before this one are already logged and will still be released by their workers
+                log(
+                    "ERROR",
+                    "Failed to dispatch Elastic IP releases to worker invocation",
+                    allocation_ids=shard,
+                    worker_function_arn=_WORKER_FUNCTION_ARN,
+                    error_type=type(e).__name__,
+                    error_message=str(e)
+                )
+                raise
+
+            # Logged per shard as soon as it is queued, so every dispatched EIP stays auditable
+            # even if a later shard fails
+            dispatched += len(shard)
+            log(
+                "INFO",
+                "Dispatched Elastic IP releases to worker invocation",
+                allocation_ids=shard,
+                action="dispatch",
+                worker_function_arn=_WORKER_FUNCTION_ARN,
+                dry_run=False
+            )
+
+    # Release phase: each release_address is an independent, I/O-bound HTTPS round-trip,
+    # so they are dispatched concurrently instead of one after the other.
+    elif not dry_run and to_release:
+        # Fail-fast (or unexpected) error seen during the release phase. It is re-raised only once every release that was
+        # already running has finished and been recorded, so no successful release goes unlogged.
+        fail_fast_error = None
+
+        try:
+            with ThreadPoolExecutor(max_workers=_RELEASE_CONCURRENCY) as executor:
+                futures = {
+                    executor.submit(ec2.release_address, AllocationId=allocation_id): allocation_id
+                    for allocation_id in to_release
+                }
+
+                # Results are consumed in the handler thread only, so the counters need no lock
+                for future in as_completed(futures):
+                    # Releases cancelled after a fail-fast error never ran
+                    if future.cancelled():
+                        continue
+
+                    allocation_id = futures[future]
+                    try:
+                        future.result()
+                        released_allocation_ids.append(allocation_id)
+
+                    except ClientError as e:
+                        per_eip_errors += 1
+                        code = e.response.get("Error", {}).get("Code", "Unknown")
+                        log(
+                            "ERROR",
+                            "AWS ClientError while releasing Elastic IP",
+                            allocation_id=allocation_id,
+                            error_code=code,
+                            error_message=str(e)
+                        )
+
+                        # Fail fast on systemic auth/permission problems: pending releases are cancelled,
+                        # releases already in flight are still drained by this loop
+                        if code in _FAIL_FAST_CODES and fail_fast_error is None:
+                            fail_fast_error = e
+                            for pending in futures:
+                                pending.cancel()
+
+                    except Exception as e:
+                        # Unexpected errors (e.g. connection failures, logic bugs) are never per-EIP:
+                        # stop dispatching, drain the in-flight releases, then re-raise
+                        log(
+                            "ERROR",
+                            "Unexpected error while releasing Elastic IP",
+                            allocation_id=allocation_id,
+                            error_type=type(e).__name__,
+                            error_message=str(e)
+                        )
+                        if fail_fast_error is None:
+                            fail_fast_error = e
+                            for pending in futures:
+                                pending.cancel()
+
+            if fail_fast_error is not None:
+                raise fail_fast_error
+
+        finally:
+            # Logged even when a fail-fast error aborts the release phase: the loop above drains
+            # every release that was already running, so each EIP actually released is listed here.
+            released = len(released_allocation_ids)
+            if released_allocation_ids:
+                log(
+                    "INFO",
+                    "Released unassociated Elastic IPs",
+                    allocation_ids=released_allocation_ids,
+                    action="release",
+                    dry_run=False
+                )
+
     # Explicit end-of-execution marker:
     # This log confirms that the Lambda completed all processing
     # without timing out or raising an exception.
     # It is used later for log queries, metrics, and run validation.
-    log(
+    # The summary and the EMF record are written together, in a single stdout write.
+    # Counters are looked up by the field names of _COUNTER_METRIC_NAMES (the local variables above),
+    # so the summary and the EMF record cannot drift from the table.
+    run_locals = locals()
+    counters: dict[str, int] = {field: run_locals[field] for field in _COUNTER_METRIC_NAMES}
+    payload = _format_log(
         "INFO",
         "ManageEIPs completed",
         dry_run=dry_run,
-        scanned=scanned,
-        skipped_not_managed=skipped_not_managed,
-        skipped_protected=skipped_protected,
-        associated=associated,
-        would_release=would_release,
-        released=released,
-        per_eip_errors=per_eip_errors
+        worker=worker,
+        **counters
     )
 
 
     # Optional custom metrics (EMF)
-    if METRICS_ENABLED:
-        emit_emf_metrics(
-            namespace=METRICS_NAMESPACE,
-            dimensions={"FunctionName": (context.function_name if context else "ManageEIPs")},
-            metrics={
-                "EIPsScanned": scanned,
-                "EIPsSkippedNotManaged": skipped_not_managed,
-                "EIPsSkippedProtected": skipped_protected,
-                "EIPsAssociated": associated,
-                "EIPsWouldRelease": would_release,
-                "EIPsReleased": released,
-                "EIPsPerEipErrors": per_eip_errors,
-            }
+    if _METRICS_ENABLED:
+        payload += _format_emf_metrics(
+            function_name=(context.function_name if context else "ManageEIPs"),
+            counters=counters,
+            timestamp_ms=started_ms,
+            worker=worker
         )
 
+    _LOG_BUFFER.append(payload)
 
     return {
         'statusCode': 200,